@@ -1,6 +1,8 @@
 import sys
-from mcp.server.fastmcp import FastMCP 
-from tools.weather import get_weather 
+from contextlib import asynccontextmanager
+from collections.abc import AsyncIterator
+from mcp.server.fastmcp import Context, FastMCP
+from tools.weather import create_client, get_weather
 from typing import Any
 
 # Ensure UTF-8 output so tool responses can include non-ASCII characters (e.g., wttr.in emojis)
@@ -9,15 +11,24 @@ if hasattr(sys.stdout, "reconfigure"):
     sys.stdout.reconfigure(encoding="utf-8")
     sys.stderr.reconfigure(encoding="utf-8")
 
-mcp = FastMCP("Weather Checker")
+
+@asynccontextmanager
+async def lifespan(server: FastMCP) -> AsyncIterator[dict[str, Any]]:
+    # FastMCP enters the lifespan once per session (SSE / streamable-HTTP serve many), so each session
+    # gets its own wttr.in client and closing it on disconnect can't affect the others.
+    async with create_client() as client:
+        yield {"client": client}
+
+
+mcp = FastMCP("Weather Checker", lifespan=lifespan)
 
 @mcp.tool()
-async def check_weather(location: str) -> str:
+async def check_weather(location: str, ctx: Context) -> str:
     """
     Get weather information for a specified location.
     """
-    return get_weather(location)
+    return await get_weather(location, ctx.request_context.lifespan_context["client"])
 
 
 if __name__ == "__main__":
-    mcp.run(transport="stdio")
\ No newline at end of file
+    mcp.run(transport="stdio")
@@ -1,24 +1,65 @@
-import urllib.request
+import time
+from collections import OrderedDict
 
-def get_weather(location:str) -> str:
+import httpx
+
+
+def create_client() -> httpx.AsyncClient:
+    """
+    Build the HTTP client used for wttr.in lookups.
+
+    The server creates one per session and reuses it, so repeat calls share the pooled (HTTP/2,
+    keep-alive) connection instead of paying a fresh TCP+TLS handshake every time.
+    """
+    # The transport retries failed connection attempts, so a dropped pooled connection is re-established
+    # instead of surfacing as an error.
+    # Add a basic User-Agent to avoid occasional blocks from some environments.
+    return httpx.AsyncClient(
+        transport=httpx.AsyncHTTPTransport(
+            http2=True,
+            retries=2,
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+        ),
+        timeout=10.0,
+        headers={"User-Agent": "Mozilla/5.0"},
+    )
+
+
+# wttr.in reports only change every few minutes, so identical lookups are served from memory.
+# Reads and writes happen between awaits on the event loop thread, so no lock is needed.
+_CACHE_TTL_SECONDS = 120
+_CACHE_MAX_ENTRIES = 512
+_cache: OrderedDict[str, tuple[float, str]] = OrderedDict()
+
+
+async def get_weather(location:str, client: httpx.AsyncClient) -> str:
     """
     Get the weather for a given location
-    
+
     Args:
         location: The location to get the weather for
-        
+        client: The HTTP client to send the request with (see create_client)
+
     Returns:
         The weather for the given location
     """
-    
+
+    key = location.strip().lower()
+    cached = _cache.get(key)
+    if cached and time.monotonic() - cached[0] < _CACHE_TTL_SECONDS:
+        _cache.move_to_end(key)
+        return cached[1]
+
     try:
-        url = f"https://wttr.in/{location}?format=3"
-        # Add a basic User-Agent to avoid occasional blocks from some environments.
-        req = urllib.request.Request(url, headers={"User-Agent": "Mozilla/5.0"})
-        with urllib.request.urlopen(req) as response:
-            result = response.read().decode('utf-8').strip()
-            return result
+        response = await client.get(f"https://wttr.in/{location}", params={"format": "3"})
+        response.raise_for_status()
+        result = response.text.strip()
     except Exception as e:
         return f"Error getting weather: {e}"
-    
-    
\ No newline at end of file
+
+    _cache[key] = (time.monotonic(), result)
+    _cache.move_to_end(key)
+    if len(_cache) > _CACHE_MAX_ENTRIES:
+        _cache.popitem(last=False)
+    return result
+
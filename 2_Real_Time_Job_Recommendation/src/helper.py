@@ -1,7 +1,12 @@
-import fitz  # PymuPDF
+import functools
+import multiprocessing
 import os 
+import shutil
+import tempfile
+import threading
+from concurrent.futures import ProcessPoolExecutor
 from dotenv import load_dotenv
-from groq import Groq
+from src import llm_cache
 
 
 load_dotenv()
@@ -9,20 +14,103 @@ load_dotenv()
 GROQ_API_KEY = os.getenv("GROQ_API_KEY")
 os.environ["GROQ_API_KEY"] = GROQ_API_KEY
 
-client = Groq(api_key=GROQ_API_KEY)
+
+# PyMuPDF and the Groq SDK are slow to import, so they are loaded on first use rather than at startup.
+@functools.cache
+def _get_groq_client():
+    from groq import Groq
+    return Groq(api_key=GROQ_API_KEY)
+
+
+def _page_text(page):
+    import fitz  # PymuPDF (already loaded by the caller)
+    # PyMuPDF's default text flags minus TEXT_PRESERVE_LIGATURES (ligatures are expanded to plain letters).
+    flags = fitz.TEXT_PRESERVE_WHITESPACE | fitz.TEXT_MEDIABOX_CLIP | fitz.TEXT_CID_FOR_UNKNOWN_UNICODE
+    return page.get_text("text", flags=flags)
+
+
+# A text-dense page takes ~2.5 ms to extract, while each worker pays for importing PyMuPDF and
+# reopening the document, and the first call also waits ~0.6 s for the pool to spawn.
+# Only long documents (~160 ms of sequential work at this size) are worth splitting.
+PARALLEL_MIN_PAGES = 64
+PARALLEL_WORKERS = min(os.cpu_count() or 1, 4)
+
+# Uploads without a backing file are copied to disk in chunks of this size.
+SPOOL_CHUNK_SIZE = 1024 * 1024
+
+
+def _extract_page_range(path, start, stop):
+    # Runs in a worker process: PyMuPDF is not thread-safe, so each worker opens its own document.
+    import fitz  # PymuPDF
+    with fitz.open(path) as doc:
+        return "".join(_page_text(doc.load_page(i)) for i in range(start, stop))
+
+
+# One pool for the life of the process: Streamlit reruns the script on every interaction but keeps
+# imported modules, so the workers are spawned once rather than per upload.
+# "spawn" avoids forking a process that already has Streamlit's threads running.
+# Each Streamlit session runs on its own thread, so creation is locked to avoid spawning (and leaking) extra pools.
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def _get_pool():
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ProcessPoolExecutor(max_workers=PARALLEL_WORKERS, mp_context=multiprocessing.get_context("spawn"))
+        return _pool
+
+
+def _extract_text_from_path(path):
+    import fitz  # PymuPDF
+    with fitz.open(path) as doc:
+        page_count = doc.page_count
+        if page_count < PARALLEL_MIN_PAGES:
+            return "".join(_page_text(page) for page in doc)
+
+    step = -(-page_count // PARALLEL_WORKERS)
+    starts = range(0, page_count, step)
+    stops = [min(start + step, page_count) for start in starts]
+    return "".join(_get_pool().map(_extract_page_range, [path] * len(starts), starts, stops))
+
+
+def _local_path(uploaded_file):
+    # Only trust .name on real OS-level files: an upload's .name is the client-supplied filename.
+    try:
+        uploaded_file.fileno()
+    except (AttributeError, OSError):
+        return None
+    name = getattr(uploaded_file, "name", None)
+    return name if isinstance(name, str) and os.path.isfile(name) else None
 
 
 def extract_text_from_pdf(uploaded_file):
-    doc = fitz.open(stream=uploaded_file.read(), filetype="pdf")
-    text = ""
-    for page in doc:
-        text += page.get_text()
-    return text
+    # Let MuPDF read from a file rather than handing it a full bytes copy of the upload.
+    path = _local_path(uploaded_file)
+    if path is not None:
+        return _extract_text_from_path(path)
+
+    with tempfile.NamedTemporaryFile(suffix=".pdf", delete_on_close=False) as tmp:
+        shutil.copyfileobj(uploaded_file, tmp, SPOOL_CHUNK_SIZE)
+        tmp.close()
+        return _extract_text_from_path(tmp.name)
 
 def ask_groq_llm(prompt,max_tokens=1000):
-    response = client.chat.completions.create(
-        model="llama-3.1-8b-instant",
+    model = "llama-3.1-8b-instant"
+    key = llm_cache.make_key(model, max_tokens, prompt)
+    cached = llm_cache.get(key)
+    if cached is not None:
+        return cached
+
+    # Stream so tokens are collected while Groq is still generating.
+    stream = _get_groq_client().chat.completions.create(
+        model=model,
         messages=[{"role": "user", "content": prompt}],
         max_tokens=max_tokens,
+        stream=True,
     )
-    return response.choices[0].message.content
\ No newline at end of file
+    content = "".join(chunk.choices[0].delta.content or "" for chunk in stream if chunk.choices)
+    if content:
+        llm_cache.put(key, content)
+    return content
\ No newline at end of file
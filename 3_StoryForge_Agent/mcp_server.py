@@ -1,17 +1,23 @@
+import asyncio
+
 from mcp.server.fastmcp import FastMCP
-from storyforge_core import get_realtime_info, generate_video_transcription
+from storyforge_core import fetch_source_info, get_realtime_info, summarize_and_script
 
 mcp = FastMCP("this is for real time news ")
 
 @mcp.tool()
 async def fetch_new_mcp(query):
-    return get_realtime_info(query=query)
+    # Tavily/Groq SDK calls are blocking; run them off the event loop so concurrent tool calls overlap.
+    return await asyncio.to_thread(get_realtime_info, query=query)
 
 
 @mcp.tool()
 async def gen_vid_trans_mcp(query):
-    news = get_realtime_info(query=query)
-    return generate_video_transcription(news)
+    # One Groq completion yields both the summary and the script, instead of summarizing first
+    # and then feeding the summary into a second completion.
+    source_info = await asyncio.to_thread(fetch_source_info, query=query)
+    parsed = await asyncio.to_thread(summarize_and_script, query, source_info)
+    return parsed["script"]
 
 
 if __name__ == "__main__":
@@ -1,32 +1,131 @@
+from __future__ import annotations
+
+import functools
+import json
 import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING
 from dotenv import load_dotenv
-from groq import Groq
-from tavily import TavilyClient
+
+if TYPE_CHECKING:
+    from groq import Groq
+    from tavily import TavilyClient
 
 load_dotenv()
 
 
+# Prompt templates are built once at import; each call only interpolates the request-specific fields.
+_INFO_TEMPLATE = """
+You are a professional researcher and content creator with expertise in multiple fields.
+Using the following real-time information, write an accurate, engaging, and human-like summary
+for the topic: '{query}'.
+
+Requirements:
+- Keep it factual, insightful, and concise (around 200 words).
+- Maintain a smooth, natural tone.
+- Highlight key takeaways or trends.
+- Avoid greetings or self-references.
+
+Source information:
+{source_info}
+
+Output only the refined, human-readable content.
+"""
+
+_SCRIPT_TEMPLATE = """
+You are a creative scriptwriter.
+Turn this real-time information into an engaging short video script (for YouTube Shorts or Instagram Reels).
+Use a conversational tone with a strong hook and a clear call to action at the end.
+Keep it around 100–120 words.
+
+{info_text}
+"""
+
+_SUMMARY_AND_SCRIPT_TEMPLATE = """
+You are a professional researcher and a creative scriptwriter.
+Using the following real-time information about the topic: '{query}', write two pieces of content.
+
+1. "summary": an accurate, engaging, and human-like summary.
+   - Keep it factual, insightful, and concise (around 200 words).
+   - Maintain a smooth, natural tone.
+   - Highlight key takeaways or trends.
+   - Avoid greetings or self-references.
+2. "script": an engaging short video script (for YouTube Shorts or Instagram Reels).
+   - Use a conversational tone with a strong hook and a clear call to action at the end.
+   - Keep it around 100–120 words.
+
+Source information:
+{source_info}
+
+Respond with a JSON object only: {{"summary": "...", "script": "..."}}
+"""
+
+
+# Clients are built once and reused so their underlying httpx connection pools
+# (and the TLS sessions to api.tavily.com / api.groq.com) survive across calls.
+# The SDKs themselves are imported on first use to keep MCP server start-up fast.
+@functools.lru_cache(maxsize=1)
 def _get_tavily_client() -> TavilyClient:
+    from tavily import TavilyClient
+
     api_key = os.getenv("TAVILY_API_KEY")
     if not api_key:
         raise RuntimeError("TAVILY_API_KEY is not set")
     return TavilyClient(api_key=api_key)
 
 
+@functools.lru_cache(maxsize=1)
 def _get_groq_client() -> Groq:
+    from groq import Groq
+
     api_key = os.getenv("GROQ_API_KEY")
     if not api_key:
         raise RuntimeError("GROQ_API_KEY is not set")
     return Groq(api_key=api_key)
 
 
-def get_realtime_info(query: str, *, max_results: int = 3) -> str:
+# Short-lived LRU of Tavily responses keyed by (normalized query, max_results), so bursts of the
+# same question pay the search round-trip once. Guarded by a lock because MCP tools call in from threads.
+_TAVILY_CACHE_TTL_SECONDS = 180
+_TAVILY_CACHE_MAX_ENTRIES = 256
+_tavily_cache: OrderedDict[tuple[str, int], tuple[float, dict]] = OrderedDict()
+_tavily_cache_lock = threading.Lock()
+
+
+def _search_tavily(query: str, max_results: int) -> dict:
+    key = (query.strip().lower(), max_results)
+    with _tavily_cache_lock:
+        cached = _tavily_cache.get(key)
+        if cached and time.monotonic() - cached[0] < _TAVILY_CACHE_TTL_SECONDS:
+            _tavily_cache.move_to_end(key)
+            return cached[1]
+
+    resp = _get_tavily_client().search(query=query, max_results=max_results, topic="general")
+
+    with _tavily_cache_lock:
+        _tavily_cache[key] = (time.monotonic(), resp)
+        _tavily_cache.move_to_end(key)
+        if len(_tavily_cache) > _TAVILY_CACHE_MAX_ENTRIES:
+            _tavily_cache.popitem(last=False)
+    return resp
+
+
+def _stream_completion(client: Groq, **kwargs) -> str:
     """
-    Fetches up-to-date information about any topic using Tavily Search API
-    and summarizes it using Groq.
+    Runs a streamed chat completion and joins the deltas as they arrive.
+    """
+    stream = client.chat.completions.create(stream=True, **kwargs)
+    return "".join(chunk.choices[0].delta.content or "" for chunk in stream if chunk.choices)
+
+
+def fetch_source_info(query: str, *, max_results: int = 3) -> str:
+    """
+    Fetches up-to-date search results for a topic from Tavily and formats them as source text.
     """
-    tavily_client = _get_tavily_client()
-    resp = tavily_client.search(query=query, max_results=max_results, topic="general")
+    resp = _search_tavily(query, max_results)
 
     if resp and resp.get("results"):
         summaries = []
@@ -38,51 +137,85 @@ def get_realtime_info(query: str, *, max_results: int = 3) -> str:
         source_info = "\n\n---\n\n".join(summaries)
     else:
         source_info = f"No recent updates found on '{query}'."
+    return source_info
 
-    model = os.getenv("GROQ_MODEL_INFO", "llama-3.1-8b-instant")
-    prompt = f"""
-You are a professional researcher and content creator with expertise in multiple fields.
-Using the following real-time information, write an accurate, engaging, and human-like summary
-for the topic: '{query}'.
-
-Requirements:
-- Keep it factual, insightful, and concise (around 200 words).
-- Maintain a smooth, natural tone.
-- Highlight key takeaways or trends.
-- Avoid greetings or self-references.
 
-Source information:
-{source_info}
+def get_realtime_info(query: str, *, max_results: int = 3) -> str:
+    """
+    Fetches up-to-date information about any topic using Tavily Search API
+    and summarizes it using Groq.
+    """
+    source_info = fetch_source_info(query, max_results=max_results)
 
-Output only the refined, human-readable content.
-"""
+    model = os.getenv("GROQ_MODEL_INFO", "llama-3.1-8b-instant")
+    prompt = _INFO_TEMPLATE.format_map({"query": query, "source_info": source_info})
 
     client = _get_groq_client()
-    response = client.chat.completions.create(
+    content = _stream_completion(
+        client,
         model=model,
         messages=[{"role": "user", "content": prompt}],
         max_tokens=400,
     )
-    content = response.choices[0].message.content if response and response.choices else None
     return content.strip() if content else source_info
 
 
 def generate_video_transcription(info_text: str) -> str:
-    prompt = f"""
-You are a creative scriptwriter.
-Turn this real-time information into an engaging short video script (for YouTube Shorts or Instagram Reels).
-Use a conversational tone with a strong hook and a clear call to action at the end.
-Keep it around 100–120 words.
-
-{info_text}
-"""
+    prompt = _SCRIPT_TEMPLATE.format_map({"info_text": info_text})
     model = os.getenv("GROQ_MODEL_SCRIPT", "llama-3.1-8b-instant")
     client = _get_groq_client()
-    response = client.chat.completions.create(
+    content = _stream_completion(
+        client,
         model=model,
         messages=[{"role": "user", "content": prompt}],
         max_tokens=220,
     )
-    content = response.choices[0].message.content if response and response.choices else None
     return content.strip() if content else "⚠️ Could not generate video script."
 
+
+def summarize_and_script(query: str, source_info: str) -> dict[str, str]:
+    """
+    Produces both the topic summary and the short video script from one Groq completion.
+
+    If Groq rejects the JSON output (json_validate_failed) or the reply lacks a usable script,
+    falls back to the separate summary and script completions.
+
+    Returns a dict with "summary" and "script" keys.
+    """
+    from groq import BadRequestError
+
+    prompt = _SUMMARY_AND_SCRIPT_TEMPLATE.format_map({"query": query, "source_info": source_info})
+    model = os.getenv("GROQ_MODEL_INFO", "llama-3.1-8b-instant")
+    client = _get_groq_client()
+    try:
+        response = client.chat.completions.create(
+            model=model,
+            messages=[{"role": "user", "content": prompt}],
+            response_format={"type": "json_object"},
+            max_tokens=650,
+        )
+    except BadRequestError:
+        response = None
+    content = response.choices[0].message.content if response and response.choices else None
+    try:
+        parsed = json.loads(content) if content else {}
+    except json.JSONDecodeError:
+        parsed = {}
+    if not isinstance(parsed, dict):
+        parsed = {}
+    summary = parsed.get("summary")
+    script = parsed.get("script")
+    summary = summary.strip() if isinstance(summary, str) else ""
+    script = script.strip() if isinstance(script, str) else ""
+
+    if not script:
+        # The script only needs the source text, so the two fallback completions run side by side.
+        # get_realtime_info re-reads the cached Tavily results rather than searching again.
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            summary_future = pool.submit(get_realtime_info, query)
+            script_future = pool.submit(generate_video_transcription, source_info)
+            summary, script = summary_future.result(), script_future.result()
+    return {
+        "summary": summary or source_info,
+        "script": script,
+    }
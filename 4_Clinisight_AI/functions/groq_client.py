@@ -0,0 +1,13 @@
+import functools
+import os
+from dotenv import load_dotenv
+
+load_dotenv()
+
+
+# The Groq SDK is slow to import, so it is loaded (and the client built) on first use.
+# Shared by every module in this package so they reuse one connection pool.
+@functools.cache
+def get_client():
+    from groq import Groq
+    return Groq(api_key=os.getenv("GROQ_API_KEY"))
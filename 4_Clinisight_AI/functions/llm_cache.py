@@ -0,0 +1,66 @@
+"""
+Tiny SQLite-backed cache for LLM completions.
+
+Responses are keyed by a SHA-256 of everything that shapes the completion (model, limits, prompt),
+so a byte-identical request is answered from disk instead of another round-trip to Groq.
+The cache is best-effort: if the database can't be opened or written, callers just go to Groq.
+"""
+
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+
+CACHE_PATH = os.getenv(
+    "LLM_CACHE_PATH",
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), ".llm_cache.sqlite3"),
+)
+
+_lock = threading.Lock()
+_conn = None
+
+
+def _connection() -> sqlite3.Connection:
+    global _conn
+    if _conn is None:
+        # Streamlit / FastMCP may call from worker threads, so share one connection behind a lock.
+        conn = sqlite3.connect(CACHE_PATH, check_same_thread=False)
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("CREATE TABLE IF NOT EXISTS kv (hash TEXT PRIMARY KEY, value TEXT, ts INTEGER)")
+        except sqlite3.Error:
+            conn.close()
+            raise
+        _conn = conn
+    return _conn
+
+
+def make_key(*parts) -> str:
+    """Build a deterministic cache key from the parts of an LLM request."""
+    return hashlib.sha256("|".join(str(p) for p in parts).encode("utf-8")).hexdigest()
+
+
+def get(key: str) -> str | None:
+    """Return the cached value for key, or None on a miss or if the cache is unavailable."""
+    try:
+        with _lock:
+            row = _connection().execute("SELECT value FROM kv WHERE hash = ?", (key,)).fetchone()
+    except sqlite3.Error:
+        return None
+    return row[0] if row else None
+
+
+def put(key: str, value: str) -> None:
+    """Store value under key, replacing any previous entry. Failures are ignored."""
+    try:
+        with _lock:
+            conn = _connection()
+            conn.execute(
+                "INSERT OR REPLACE INTO kv (hash, value, ts) VALUES (?, ?, ?)",
+                (key, value, int(time.time())),
+            )
+            conn.commit()
+    except sqlite3.Error:
+        pass
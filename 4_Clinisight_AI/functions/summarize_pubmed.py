@@ -1,19 +1,30 @@
-import os
-from groq import Groq
 from dotenv import load_dotenv
+from functions.groq_client import get_client
+from functions import llm_cache
 
 load_dotenv()
-client = Groq(api_key=os.getenv("GROQ_API_KEY"))
+
 
 def summarize_text(text: str) -> str:
     prompt = f"Summarize the following medical abstract:\n\n{text}"
+    system_prompt = "You are a medical research summarizer."
+    model = "llama-3.1-8b-instant"  # Or "gpt-3.5-turbo"
+
+    key = llm_cache.make_key(model, system_prompt, prompt)
+    cached = llm_cache.get(key)
+    if cached is not None:
+        return cached
 
-    response = client.chat.completions.create(
-        model="llama-3.1-8b-instant",  # Or "gpt-3.5-turbo"
+    stream = get_client().chat.completions.create(
+        model=model,
         messages=[
-            {"role": "system", "content": "You are a medical research summarizer."},
+            {"role": "system", "content": system_prompt},
             {"role": "user", "content": prompt}
-        ]
+        ],
+        stream=True,
     )
 
-    return response.choices[0].message.content.strip()
\ No newline at end of file
+    summary = "".join(chunk.choices[0].delta.content or "" for chunk in stream if chunk.choices).strip()
+    if summary:
+        llm_cache.put(key, summary)
+    return summary
\ No newline at end of file
@@ -1,3 +1,5 @@
+import asyncio
+
 from mcp.server.fastmcp import FastMCP 
 from functions.symptom_extractor import extract_symptoms
 from functions.diagnosis_symptoms import get_diagnosis
@@ -7,12 +9,20 @@ from functions.summarize_pubmed import summarize_text
 mcp = FastMCP("Clinisight AI")
 
 
+def _pubmed_summary(symptom):
+    pubmed_article = fetch_pubmed_articles_with_metadata(" ".join(symptom))
+    return summarize_text(pubmed_article[:3000])
+
+
 @mcp.tool()
 async def clinisight_ai(symptom_text):
     symptom = extract_symptoms(symptom_text)
-    diagnosis_result = get_diagnosis(symptom)
-    pubmed_article = fetch_pubmed_articles_with_metadata(" ".join(symptom))
-    summary = summarize_text(pubmed_article[:3000])
+    # The diagnosis and the PubMed summary only depend on the symptoms, not on each other,
+    # so their blocking Groq/PubMed calls run concurrently in worker threads.
+    diagnosis_result, summary = await asyncio.gather(
+        asyncio.to_thread(get_diagnosis, symptom),
+        asyncio.to_thread(_pubmed_summary, symptom),
+    )
 
     return {
         "symptom":symptom,
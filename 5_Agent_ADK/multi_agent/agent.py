@@ -1,4 +1,10 @@
+import logging
+import re
+from typing import Optional
 from google.adk.agents import Agent 
+from google.adk.agents.callback_context import CallbackContext
+from google.adk.models import LlmRequest, LlmResponse
+from google.genai import types
 from google.adk.runners import Runner
 from google.adk.sessions import Session
 from google.adk.memory import InMemoryMemoryService
@@ -6,6 +12,8 @@ from dotenv import load_dotenv
 
 load_dotenv()
 
+log = logging.getLogger(__name__)
+
 root_agent_model = "gemini-2.0-flash-exp"
 sub_agent_model = "gemini-2.0-flash"
 
@@ -35,17 +43,28 @@ def say_hello(name: str = "there") -> str:
     Returns:
         str: A friendly greeting message.
     """
-    print(f"--- Tool: say_hello called with name: {name} ---")
+    if log.isEnabledFor(logging.DEBUG):
+        log.debug("Tool: say_hello called with name: %s", name)
     return f"Hello, {name}!"
 
 
 def say_goodbye() -> str:
     """Provides a simple farewell message to conclude the conversation."""
-    print(f"--- Tool: say_goodbye called ---")
+    if log.isEnabledFor(logging.DEBUG):
+        log.debug("Tool: say_goodbye called")
     return "Goodbye! Have a great day."
 
 
 
+# Known weather reports keyed by lowercased city name; add new cities here.
+_REPORTS: dict[str, str] = {
+    "new york": (
+        "The weather in New York is sunny with a temperature of 25 degrees "
+        "Celsius (41 degrees Fahrenheit)."
+    ),
+}
+
+
 def get_weather(city: str) -> dict:
     """Retrieves the current weather report for a specified city.
 
@@ -55,20 +74,53 @@ def get_weather(city: str) -> dict:
     Returns:
         dict: status and result or error msg.
     """
-    if city.lower() == "new york":
-        return {
-            "status": "success",
-            "report": (
-                "The weather in New York is sunny with a temperature of 25 degrees "
-                "Celsius (41 degrees Fahrenheit)."
-            ),
-        }
-    
+    report = _REPORTS.get(city.lower())
+    if report is not None:
+        return {"status": "success", "report": report}
+    return {
+        "status": "error",
+        "error_message": f"Weather information for '{city}' is not available."
+    }
+
+# Whole-message greetings/farewells are answered directly from the tools, skipping the model call
+# (and the delegation to greeting_agent/farewell_agent) entirely. Anything longer falls through to the LLM.
+# A name is only taken after an explicit introduction ("hi, I'm Sam"); any other word after the
+# greeting ("hi how", "hey what") means the message isn't a bare greeting and goes to the model.
+_GREETING_RE = re.compile(
+    r"^\W*(?:hi|hello|hey|good (?:morning|afternoon|evening))\b"
+    r"(?:[\s,!.]+(?:i am|i'm|my name is|this is)\s+(?P<name>[a-z][\w'-]*))?[\s!.]*$",
+    re.IGNORECASE,
+)
+_FAREWELL_RE = re.compile(
+    r"^\W*(?:(?:ok|okay|thanks|thank you)\W+)*(?:bye|goodbye|see you(?: later| soon)?)\b[\s!.]*$",
+    re.IGNORECASE,
+)
+
+
+def route_trivial_intents(
+    callback_context: CallbackContext, llm_request: LlmRequest
+) -> Optional[LlmResponse]:
+    """Answers plain greetings and farewells without invoking the model.
+
+    Args:
+        callback_context (CallbackContext): The ADK callback context (unused).
+        llm_request (LlmRequest): The request about to be sent to the model.
+
+    Returns:
+        Optional[LlmResponse]: A canned response for a trivial intent, or None to call the model as usual.
+    """
+    if not llm_request.contents or llm_request.contents[-1].role != "user":
+        return None
+    text = "".join(part.text or "" for part in llm_request.contents[-1].parts or []).strip()
+
+    if match := _GREETING_RE.match(text):
+        reply = say_hello(match.group("name") or "there")
+    elif _FAREWELL_RE.match(text):
+        reply = say_goodbye()
     else:
-        return {
-            "status": "error",
-            "error_message": f"Weather information for '{city}' is not available."
-        }
+        return None
+    return LlmResponse(content=types.Content(role="model", parts=[types.Part(text=reply)]))
+
 
 greeting_agent = Agent(
     # Using a potentially different/cheaper model for a simple task
@@ -108,7 +160,8 @@ root_agent = Agent(
                 "For anything else, respond appropriately or state you cannot handle it.",
 
     tools=[get_weather],
-    sub_agents=[greeting_agent, farewell_agent]
+    sub_agents=[greeting_agent, farewell_agent],
+    before_model_callback=route_trivial_intents,
 )
 
 
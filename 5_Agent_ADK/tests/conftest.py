@@ -0,0 +1,6 @@
+import sys
+from pathlib import Path
+
+# The agent packages (e.g. multi_agent) live next to this directory, not in an installed package,
+# so make them importable however pytest is launched (repo root, 5_Agent_ADK, or tests/).
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
@@ -0,0 +1,57 @@
+import pytest
+
+pytest.importorskip("google.adk")
+
+from google.adk.models import LlmRequest
+from google.genai import types
+
+from multi_agent.agent import route_trivial_intents
+
+
+def _route(text):
+    request = LlmRequest(contents=[types.Content(role="user", parts=[types.Part(text=text)])])
+    response = route_trivial_intents(None, request)
+    return response.content.parts[0].text if response else None
+
+
+@pytest.mark.parametrize(
+    "text, reply",
+    [
+        ("hi", "Hello, there!"),
+        ("Good morning!", "Hello, there!"),
+        ("hi, I'm Alice", "Hello, Alice!"),
+        ("Hello, my name is Bob.", "Hello, Bob!"),
+        ("Thanks, bye!", "Goodbye! Have a great day."),
+        ("see you later", "Goodbye! Have a great day."),
+    ],
+)
+def test_trivial_intents_are_answered_without_the_model(text, reply):
+    assert _route(text) == reply
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "hello help",
+        "Hey what",
+        "hi how",
+        "hey you",
+        "hi, what's the weather in New York?",
+        "what is bye",
+    ],
+)
+def test_other_messages_reach_the_model(text):
+    assert _route(text) is None
+
+
+def test_function_responses_reach_the_model():
+    request = LlmRequest(
+        contents=[
+            types.Content(role="user", parts=[types.Part(text="hi")]),
+            types.Content(
+                role="model",
+                parts=[types.Part(function_call=types.FunctionCall(name="get_weather", args={"city": "x"}))],
+            ),
+        ]
+    )
+    assert route_trivial_intents(None, request) is None
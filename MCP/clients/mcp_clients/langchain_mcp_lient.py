@@ -7,6 +7,9 @@ This file implements an MCP client that:
   - Instantiates the ChatGroq model using your GROQ_API_KEY.
   - Creates a React agent using LangGraph’s prebuilt agent (create_react_agent) with the LLM and tools.
   - Runs an interactive asynchronous chat loop for processing user queries.
+  - Optionally (--daemon) keeps the server and session alive and serves queries sent with --attach
+    over a user-only Unix socket (token-protected loopback TCP on Windows), so scripted one-shot
+    calls don't pay for a new server process each time.
 
 Detailed explanations:
   - Retries (max_retries=2): If an API call fails due to transient errors (e.g., network issues),
@@ -15,27 +18,181 @@ Detailed explanations:
     Higher values (e.g., 0.7) yield more creative, varied responses.
   - GOOGLE_API_KEY: Required for authentication with Google’s generative AI service.
   
-Responses are printed as JSON using a custom encoder to handle non-serializable objects.
+Responses are printed as JSON (via orjson) using a custom default hook to handle non-serializable objects.
 """
 
 import asyncio                        # For asynchronous operations
 import argparse                       # For CLI flags (interactive vs one-shot)
 import os                             # To access environment variables
 import sys                            # For command-line argument processing
-import json                           # For pretty-printing JSON output
+import json                           # For the daemon's JSON-lines protocol and the tool cache
+import hashlib                        # For hashing tool-cache keys
+import hmac                           # Constant-time comparison of the daemon token
+import secrets                        # Random daemon token (TCP fallback on Windows)
+from pathlib import Path              # For the on-disk tool schema cache
 from contextlib import AsyncExitStack # Ensures all async resources are properly closed
 from typing import Optional, List     # For type hints
 
+import orjson                         # Fast (native) JSON encoding for printed responses
+
+# ---------------------------
+# Environment Setup
+# ---------------------------
+# Loaded before argument parsing so .env values (e.g. MCP_CLIENT_PORT) apply to CLI defaults too.
+from dotenv import load_dotenv
+load_dotenv()  # Loads environment variables from a local .env file if present
+
+# ---------------------------
+# MCP Server Script Argument
+# ---------------------------
+# Parsed before the heavy MCP/LangChain imports below so `--help` and usage errors return instantly.
+parser = argparse.ArgumentParser(description="LangChain + MCP client (Groq)")
+parser.add_argument(
+    "server_script",
+    nargs="?",
+    help="Path to MCP server script (python or node). Not needed with --attach.",
+)
+parser.add_argument(
+    "--once",
+    dest="once",
+    action="append",
+    default=None,
+    help="Run a query (non-interactive) and exit. Repeat to run several queries concurrently.",
+)
+parser.add_argument(
+    "--once-file",
+    dest="once_file",
+    default=None,
+    help="Run every non-empty line of this file as an independent query (concurrently) and exit.",
+)
+parser.add_argument(
+    "--daemon",
+    action="store_true",
+    help="Keep the MCP server and session alive and serve queries on a user-only local socket (see --attach).",
+)
+parser.add_argument(
+    "--attach",
+    action="store_true",
+    help="Send the --once/--once-file queries to a running --daemon instead of launching a server.",
+)
+parser.add_argument(
+    "--port",
+    type=int,
+    default=int(os.getenv("MCP_CLIENT_PORT", "8765")),
+    help="Windows only: local port used by --daemon/--attach (default: 8765 or MCP_CLIENT_PORT).",
+)
+args = parser.parse_args()
+server_script = args.server_script
+if args.attach:
+    if args.once is None and args.once_file is None:
+        parser.error("--attach requires --once or --once-file")
+elif not server_script:
+    parser.error("server_script is required unless --attach is given")
+
+# The daemon runs queries through an agent that can call the server's tools (possibly shell commands),
+# so only the current user may reach it. On POSIX that is a 0600 Unix socket in a 0700 directory.
+# Windows has no asyncio Unix sockets, so it falls back to loopback TCP plus a random token that is
+# stored in a file only this user can read.
+USE_UNIX_SOCKET = os.name != "nt"
+DAEMON_DIR = Path(os.getenv("MCP_CLIENT_DAEMON_DIR", Path.home() / ".cache" / "mcp_client"))
+DAEMON_SOCKET = DAEMON_DIR / "daemon.sock"
+DAEMON_TOKEN_FILE = DAEMON_DIR / "daemon.token"
+DAEMON_HOST = "127.0.0.1"
+# Replies carry the whole agent trace (tool output included) on one line, far beyond asyncio's
+# default 64 KiB line limit, so both ends read with this limit instead.
+DAEMON_LINE_LIMIT = 64 * 1024 * 1024
+
+
+def daemon_address():
+    return str(DAEMON_SOCKET) if USE_UNIX_SOCKET else f"{DAEMON_HOST}:{args.port}"
+
+
+def collect_once_queries():
+    """Gather the non-empty queries passed via --once and --once-file."""
+    queries = [q.strip() for q in (args.once or [])]
+    if args.once_file is not None:
+        with open(args.once_file, "r", encoding="utf-8") as f:
+            queries.extend(line.strip() for line in f)
+    return [q for q in queries if q]
+
+
+def print_once_results(queries, results):
+    """
+    Print one-shot results in query order; failed queries are reported on stderr.
+
+    Returns the process exit status: 1 if any query failed, else 0.
+    """
+    failed = False
+    for query, result in zip(queries, results):
+        if len(queries) > 1:
+            print(f"\nQuery: {query}")
+        if isinstance(result, Exception):
+            print(f"Error: {result}", file=sys.stderr)
+            failed = True
+        else:
+            print(result)
+    return 1 if failed else 0
+
+
+# ---------------------------
+# Thin Client for --attach
+# ---------------------------
+# Talks to a running --daemon over newline-delimited JSON, so it needs none of the heavy imports below
+# and never spawns an MCP server of its own.
+async def ask_daemon(query):
+    request = {"query": query}
+    try:
+        if USE_UNIX_SOCKET:
+            reader, writer = await asyncio.open_unix_connection(str(DAEMON_SOCKET), limit=DAEMON_LINE_LIMIT)
+        else:
+            request["token"] = DAEMON_TOKEN_FILE.read_text(encoding="utf-8").strip()
+            reader, writer = await asyncio.open_connection(DAEMON_HOST, args.port, limit=DAEMON_LINE_LIMIT)
+    except OSError as e:
+        raise RuntimeError(
+            f"No MCP client daemon listening on {daemon_address()}. Start one with --daemon."
+        ) from e
+    try:
+        writer.write((json.dumps(request) + "\n").encode("utf-8"))
+        await writer.drain()
+        line = await reader.readline()
+    except ConnectionError:
+        line = b""
+    finally:
+        writer.close()
+        try:
+            await writer.wait_closed()
+        except ConnectionError:
+            pass  # The daemon already dropped the connection; the reply (if any) has been read.
+    if not line:
+        raise RuntimeError(f"The MCP client daemon on {daemon_address()} closed the connection without replying.")
+    reply = json.loads(line)
+    if "error" in reply:
+        raise RuntimeError(reply["error"])
+    return reply["output"]
+
+
+async def run_attached():
+    queries = collect_once_queries()
+    results = await asyncio.gather(*[ask_daemon(q) for q in queries], return_exceptions=True)
+    return print_once_results(queries, results)
+
+
+if args.attach:
+    sys.exit(asyncio.run(run_attached()))
+
 # ---------------------------
 # MCP Client Imports
 # ---------------------------
 from mcp import ClientSession, StdioServerParameters  # MCP session management and startup parameters
 from mcp.client.stdio import stdio_client            # For connecting to the MCP server over stdio
+from mcp.types import Tool as MCPTool                 # MCP tool definition (name, description, input schema)
+from mcp.types import PaginatedRequestParams           # Cursor for paging through tools/list results
 
 # ---------------------------
 # Agent and LLM Imports
 # ---------------------------
 from langchain_mcp_adapters.tools import load_mcp_tools  # Adapter to load MCP tools correctly
+from langchain_mcp_adapters.tools import convert_mcp_tool_to_langchain_tool  # Builds one LangChain tool bound to a session
 try:
     # Preferred import (newer stacks)
     from langchain.agents import create_react_agent  # type: ignore
@@ -48,27 +205,21 @@ except ImportError:
 
 
 from langchain_groq import ChatGroq  # Groq LLM wrapper for LangChain
-
-# ---------------------------
-# Environment Setup
-# ---------------------------
-from dotenv import load_dotenv
-load_dotenv()  # Loads environment variables from a local .env file if present
+from langchain_core.messages import AIMessageChunk  # Token deltas emitted while the model streams
 
 # ---------------------------
 # Custom JSON Encoder
 # ---------------------------
-class CustomEncoder(json.JSONEncoder):
+def encode_default(o):
     """
-    Custom JSON encoder that handles objects with a 'content' attribute.
-    
+    orjson `default` hook that handles objects with a 'content' attribute.
+
     If an object has a 'content' attribute, it returns a dictionary with the object's type and its content.
-    Otherwise, it falls back to the default encoding.
+    Otherwise, it raises TypeError so orjson reports the value as unserializable.
     """
-    def default(self, o):
-        if hasattr(o, "content"):
-            return {"type": o.__class__.__name__, "content": o.content}
-        return super().default(o)
+    if hasattr(o, "content"):
+        return {"type": o.__class__.__name__, "content": o.content}
+    raise TypeError(f"Object of type {o.__class__.__name__} is not JSON serializable")
 
 # ---------------------------
 # LLM Instantiation
@@ -85,22 +236,11 @@ llm = ChatGroq(
     model=_model,
     temperature=0,
     api_key=_api_key,
+    max_retries=2,  # Retry transient API failures up to 2 times
+    timeout=float(os.getenv("GROQ_TIMEOUT", "60")),  # Bound each request so one slow turn can't stall the others
+    streaming=True,  # Emit tokens as they are generated so the interactive loop can print them live
 )
 
-# ---------------------------
-# MCP Server Script Argument
-# ---------------------------
-parser = argparse.ArgumentParser(description="LangChain + MCP client (Groq)")
-parser.add_argument("server_script", help="Path to MCP server script (python or node).")
-parser.add_argument(
-    "--once",
-    dest="once",
-    default=None,
-    help="Run a single query (non-interactive) and exit.",
-)
-args = parser.parse_args()
-server_script = args.server_script
-
 # ---------------------------
 # MCP Server Parameters
 # ---------------------------
@@ -110,6 +250,167 @@ server_params = StdioServerParameters(
     args=[server_script],
 )
 
+# ---------------------------
+# Streaming Helper
+# ---------------------------
+async def stream_agent(agent, query):
+    """
+    Run the agent on a query, printing model tokens as they arrive.
+
+    Returns the final agent state (the same value ainvoke would return).
+    """
+    final_state = None
+    async for mode, chunk in agent.astream({"messages": query}, stream_mode=["messages", "values"]):
+        if mode == "messages":
+            message, _metadata = chunk
+            if isinstance(message, AIMessageChunk) and isinstance(message.content, str):
+                print(message.content, end="", flush=True)
+        else:
+            final_state = chunk
+    print()
+    return final_state
+
+# ---------------------------
+# Tool Schema Cache
+# ---------------------------
+# Tool definitions only change when the server script changes, so they are cached on disk
+# keyed by the script's path and mtime. A cache hit skips the tools/list round-trip.
+TOOL_CACHE_DIR = Path(os.getenv("MCP_TOOL_CACHE_DIR", Path.home() / ".cache" / "mcp_tools"))
+
+
+def _tool_cache_path(script):
+    cache_key = f"{os.path.abspath(script)}:{os.stat(script).st_mtime_ns}"
+    return TOOL_CACHE_DIR / f"{hashlib.sha256(cache_key.encode('utf-8')).hexdigest()}.json"
+
+
+async def list_all_tools(session):
+    """Collect every tool the server advertises, following nextCursor across tools/list pages."""
+    tools, cursor = [], None
+    while True:
+        params = PaginatedRequestParams(cursor=cursor) if cursor else None
+        page = await session.list_tools(params=params)
+        tools.extend(page.tools)
+        if not page.nextCursor:
+            return tools
+        cursor = page.nextCursor
+
+
+async def load_tools_cached(session, script):
+    """
+    Load MCP tools as LangChain tools, reusing cached tool definitions when the server script is unchanged.
+
+    The returned tools still execute through the given session; only discovery is cached.
+    """
+    try:
+        cache_path = _tool_cache_path(script)
+    except OSError:
+        # Not a local file (e.g. a command on PATH): nothing to key the cache on.
+        return await load_mcp_tools(session)
+
+    if cache_path.exists():
+        try:
+            definitions = json.loads(cache_path.read_text(encoding="utf-8"))
+            return [
+                convert_mcp_tool_to_langchain_tool(session, MCPTool.model_validate(d))
+                for d in definitions
+            ]
+        except Exception:
+            pass  # Corrupt or incompatible cache entry: rediscover below.
+
+    mcp_tools = await list_all_tools(session)
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        cache_path.write_text(
+            json.dumps([t.model_dump(mode="json", by_alias=True, exclude_none=True) for t in mcp_tools]),
+            encoding="utf-8",
+        )
+    except OSError:
+        pass  # Caching is best-effort.
+    return [convert_mcp_tool_to_langchain_tool(session, t) for t in mcp_tools]
+
+# ---------------------------
+# Response Formatting
+# ---------------------------
+def format_response(response):
+    """Render an agent response as indented JSON, falling back to str() for anything unserializable."""
+    try:
+        # orjson encodes in native code, which matters for long agent traces.
+        return orjson.dumps(response, default=encode_default, option=orjson.OPT_INDENT_2).decode("utf-8")
+    except Exception:
+        return str(response)
+
+# ---------------------------
+# Daemon Mode
+# ---------------------------
+async def serve_daemon(agent):
+    """
+    Serve queries from --attach clients over a persistent MCP session.
+
+    Each line received is a JSON object {"query": ...} (plus "token" on Windows); each reply is
+    {"output": ...} or {"error": ...}. The connection is closed on the first malformed or
+    unauthenticated line, so non-client traffic (e.g. an HTTP request) never reaches the agent.
+    Connections are handled concurrently, so attached clients share one server process and one agent.
+    """
+    token = None
+    DAEMON_DIR.mkdir(parents=True, exist_ok=True)
+    if USE_UNIX_SOCKET:
+        os.chmod(DAEMON_DIR, 0o700)
+    else:
+        token = secrets.token_urlsafe(32)
+
+    async def reply(writer, message):
+        writer.write((json.dumps(message) + "\n").encode("utf-8"))
+        await writer.drain()
+
+    async def handle(reader, writer):
+        try:
+            while line := await reader.readline():
+                try:
+                    request = json.loads(line)
+                except ValueError:
+                    request = None
+                if not isinstance(request, dict) or not isinstance(request.get("query"), str):
+                    await reply(writer, {"error": "Malformed request."})
+                    break
+                if token is not None and not hmac.compare_digest(
+                    str(request.get("token", "")).encode("utf-8"), token.encode("utf-8")
+                ):
+                    await reply(writer, {"error": "Invalid daemon token."})
+                    break
+                try:
+                    output = format_response(await agent.ainvoke({"messages": request["query"].strip()}))
+                    await reply(writer, {"output": output})
+                except Exception as e:
+                    await reply(writer, {"error": str(e)})
+        finally:
+            writer.close()
+
+    if USE_UNIX_SOCKET:
+        # start_unix_server unlinks whatever is at the path, so check first that it isn't a live daemon.
+        try:
+            _, probe = await asyncio.open_unix_connection(str(DAEMON_SOCKET))
+        except OSError:
+            pass  # No socket, or a stale one left by a daemon that didn't shut down cleanly.
+        else:
+            probe.close()
+            await probe.wait_closed()
+            raise RuntimeError(f"An MCP client daemon is already listening on {daemon_address()}.")
+        # Create the socket with a restrictive umask so it is never briefly accessible to others.
+        old_umask = os.umask(0o177)
+        try:
+            server = await asyncio.start_unix_server(handle, path=str(DAEMON_SOCKET), limit=DAEMON_LINE_LIMIT)
+        finally:
+            os.umask(old_umask)
+    else:
+        server = await asyncio.start_server(handle, DAEMON_HOST, args.port, limit=DAEMON_LINE_LIMIT)
+        # Written only once the port is ours, so a second daemon can't replace a running one's token.
+        fd = os.open(DAEMON_TOKEN_FILE, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(token)
+    print(f"MCP client daemon listening on {daemon_address()}. Press Ctrl+C to stop.")
+    async with server:
+        await server.serve_forever()
+
 # Global variable to hold the active MCP session.
 # This is a simple holder with a "session" attribute for use by the tool adapter.
 mcp_client = None
@@ -125,10 +426,12 @@ async def run_agent():
       1. Open a stdio connection to the MCP server.
       2. Create and initialize an MCP session.
       3. Store the session in a global holder (mcp_client) for tool access.
-      4. Load MCP tools using load_mcp_tools.
+      4. Load MCP tools (from the on-disk schema cache when the server script is unchanged).
       5. Create a React agent using create_react_agent with the LLM and loaded tools.
-      6. Enter an interactive loop: for each user query, invoke the agent asynchronously using ainvoke,
-         then print the response as formatted JSON using our custom encoder.
+      6. With --daemon, serve --attach clients until interrupted; with --once/--once-file,
+         run those queries concurrently and return 1 if any failed (0 otherwise).
+      7. Otherwise enter an interactive loop: for each user query, stream the agent's tokens as they arrive,
+         then print the final response as formatted JSON using our custom encoder hook.
     """
     global mcp_client
     async with stdio_client(server_params) as (read, write):
@@ -136,21 +439,26 @@ async def run_agent():
             await session.initialize()  # Initialize MCP session
             # Set global mcp_client to a simple object holding the session.
             mcp_client = type("MCPClientHolder", (), {"session": session})()
-            # Load MCP tools using the adapter; this handles awaiting and conversion.
-            tools = await load_mcp_tools(session)
+            # Load MCP tools, reusing cached definitions when the server script hasn't changed.
+            tools = await load_tools_cached(session, server_script)
             # Create a React agent using the LLM and the loaded tools.
             agent = create_react_agent(llm, tools)
-            if args.once is not None:
-                query = args.once.strip()
-                if query:
-                    response = await agent.ainvoke({"messages": query})
-                    try:
-                        formatted = json.dumps(response, indent=2, cls=CustomEncoder)
-                    except Exception:
-                        formatted = str(response)
-                    print(formatted)
+            if args.daemon:
+                await serve_daemon(agent)
                 return
 
+            if args.once is not None or args.once_file is not None:
+                queries = collect_once_queries()
+                # Independent queries don't depend on each other, so run them concurrently.
+                responses = await asyncio.gather(
+                    *[agent.ainvoke({"messages": q}) for q in queries],
+                    return_exceptions=True,
+                )
+                return print_once_results(
+                    queries,
+                    [r if isinstance(r, Exception) else format_response(r) for r in responses],
+                )
+
             print("MCP Client Started! Type 'quit' to exit.")
             while True:
                 try:
@@ -163,7 +471,8 @@ async def run_agent():
                     break
                 # The agent expects input as a dict with key "messages".
                 try:
-                    response = await agent.ainvoke({"messages": query})
+                    print("\nAssistant: ", end="", flush=True)
+                    response = await stream_agent(agent, query)
                 except Exception as e:
                     msg = str(e)
                     if "429" in msg or "rate limit" in msg.lower() or "quota" in msg.lower():
@@ -174,11 +483,8 @@ async def run_agent():
                         )
                         continue
                     raise
-                # Format the response as JSON using the custom encoder.
-                try:
-                    formatted = json.dumps(response, indent=2, cls=CustomEncoder)
-                except Exception as e:
-                    formatted = str(response)
+                # Format the response as JSON using the custom encoder hook.
+                formatted = format_response(response)
                 print("\nResponse:")
                 print(formatted)
     return
@@ -187,4 +493,5 @@ async def run_agent():
 # Main Execution Block
 # ---------------------------
 if __name__ == "__main__":
-    asyncio.run(run_agent())
\ No newline at end of file
+    # --once/--once-file exit non-zero when any query failed, so scripts can detect it.
+    sys.exit(asyncio.run(run_agent()))
\ No newline at end of file
@@ -1,4 +1,6 @@
+import asyncio
 import os
+import signal
 import subprocess
 from pathlib import Path
 
@@ -9,8 +11,11 @@ mcp = FastMCP("terminal")
 # Default workspace (works both on host + in the provided Docker command that mounts to /root/mcp/workspace)
 DEFAULT_WORKSPACE = os.getenv("MCP_WORKSPACE", os.path.expanduser("~/mcp/workspace"))
 
-def _workspace_root() -> Path:
-    return Path(DEFAULT_WORKSPACE).expanduser().resolve()
+# Upper bound on a single run_command call, so one hung child can't tie up the server.
+COMMAND_TIMEOUT = float(os.getenv("MCP_COMMAND_TIMEOUT", "60"))
+
+# Resolved once at startup so each file tool call doesn't repeat the stat/readlink work.
+WORKSPACE_ROOT = Path(DEFAULT_WORKSPACE).expanduser().resolve()
 
 
 def _safe_path(relative_path: str) -> Path:
@@ -18,27 +23,57 @@ def _safe_path(relative_path: str) -> Path:
     Resolve a user-provided path safely under DEFAULT_WORKSPACE.
     Prevents path traversal like ../../secrets.txt.
     """
-    root = _workspace_root()
-    target = (root / relative_path).expanduser().resolve()
-    if root not in target.parents and target != root:
-        raise ValueError(f"Path must be under workspace: {root}")
+    target = (WORKSPACE_ROOT / relative_path).expanduser().resolve()
+    if not target.is_relative_to(WORKSPACE_ROOT):
+        raise ValueError(f"Path must be under workspace: {WORKSPACE_ROOT}")
     return target
 
 
+def kill_process_tree(proc) -> None:
+    """
+    Kill a shell started by run_command together with everything it spawned.
+
+    Killing only the shell would leave its children (pipelines, `sleep`, servers) holding the
+    output pipes, so the timeout would still wait for them to finish. terminal_server.py imports
+    this too.
+    """
+    try:
+        if os.name == "nt":
+            subprocess.run(["taskkill", "/F", "/T", "/PID", str(proc.pid)], capture_output=True)
+        else:
+            os.killpg(proc.pid, signal.SIGKILL)
+    except ProcessLookupError:
+        pass  # Already exited.
+
+
 @mcp.tool()
 async def run_command(command: str) -> str:
     """
     Run a shell command and return stdout (or stderr if stdout is empty).
     """
     try:
-        result = subprocess.run(
+        # Async subprocess so the event loop keeps serving other tool calls while the command runs.
+        proc = await asyncio.create_subprocess_shell(
             command,
-            shell=True,
             cwd=DEFAULT_WORKSPACE if os.path.isdir(DEFAULT_WORKSPACE) else None,
-            capture_output=True,
-            text=True,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            # Own process group, so a timeout can kill the shell's children too (POSIX only).
+            start_new_session=os.name != "nt",
         )
-        return (result.stdout or result.stderr or "").strip()
+        try:
+            stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout=COMMAND_TIMEOUT)
+        except asyncio.TimeoutError:
+            kill_process_tree(proc)
+            await proc.wait()
+            return f"Command timed out after {COMMAND_TIMEOUT:g}s: {command}"
+        except BaseException:
+            # Cancelled request or server shutdown: the command runs in its own session, so it
+            # would otherwise outlive the server.
+            kill_process_tree(proc)
+            raise
+        output = stdout.decode(errors="replace") or stderr.decode(errors="replace")
+        return output.strip()
     except Exception as e:
         return str(e)
 
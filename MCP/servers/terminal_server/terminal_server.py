@@ -1,15 +1,32 @@
-import os 
-import subprocess
+import asyncio
+import os
 from mcp.server.fastmcp import FastMCP
 
+from app import COMMAND_TIMEOUT, kill_process_tree
+
 mcp = FastMCP("terminal")
 DEFAULT_WORKSPACE = os.path.expanduser("~/mcp/workspace")
 
+
 @mcp.tool()
 async def run_command(command: str) -> str:
     try:
-        result = subprocess.run(command, shell=True, capture_output=True, text=True)
-        return result.stdout or result.stderr
+        proc = await asyncio.create_subprocess_shell(
+            command,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            start_new_session=os.name != "nt",
+        )
+        try:
+            stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout=COMMAND_TIMEOUT)
+        except asyncio.TimeoutError:
+            kill_process_tree(proc)
+            await proc.wait()
+            return f"Command timed out after {COMMAND_TIMEOUT:g}s: {command}"
+        except BaseException:
+            kill_process_tree(proc)
+            raise
+        return stdout.decode(errors="replace") or stderr.decode(errors="replace")
     except Exception as e:
         return str(e)
     